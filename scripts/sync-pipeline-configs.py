@@ -18,13 +18,23 @@ Features:
 """
 
 import requests
+from requests.adapters import HTTPAdapter
 import yaml
 import json
+import hashlib
+import functools
 import sys
 import os
 import subprocess
 import tempfile
-from typing import Dict, Any, List, Set
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, Any, FrozenSet, List, NamedTuple, Optional, Set
+
+# Prefer the libyaml C bindings, falling back to the pure-Python implementation
+try:
+    from yaml import CSafeLoader as SafeLoader, CSafeDumper as SafeDumper
+except ImportError:
+    from yaml import SafeLoader, SafeDumper
 
 # Configuration - Pipeline mappings: upstream_url -> local_path
 PIPELINE_MAPPINGS = {
@@ -33,13 +43,105 @@ PIPELINE_MAPPINGS = {
     'https://raw.githubusercontent.com/konflux-ci/build-definitions/main/pipelines/docker-build-multi-platform-oci-ta/docker-build-multi-platform-oci-ta.yaml': '.tekton/multi-arch-build-pipeline.yaml',
 }
 
+# Timeout (seconds) for all HTTP requests
+REQUEST_TIMEOUT = 30
+
+# Shared HTTP session so fetches reuse pooled connections instead of doing a
+# fresh TCP+TLS handshake per request. The pool is sized for the concurrent
+# pipeline workers.
+SESSION = requests.Session()
+SESSION.mount('https://', HTTPAdapter(pool_connections=8, pool_maxsize=8))
+
+# On-disk cache of upstream pipelines: an index of url -> {'etag': ...} plus
+# one file per url and ETag holding the downloaded body. It lives outside the repo
+# so it never ends up in sync commits; override with PIPELINE_SYNC_CACHE_DIR.
+PIPELINE_CACHE_DIR = os.environ.get('PIPELINE_SYNC_CACHE_DIR') or os.path.join(
+    os.environ.get('XDG_CACHE_HOME') or os.path.expanduser('~/.cache'), 'konflux-pipeline-sync')
+PIPELINE_CACHE_FILE = os.path.join(PIPELINE_CACHE_DIR, 'index.json')
+
+# Parameters whose local values are preserved (never overwritten with upstream
+# values) and excluded from comparison
+PRESERVE_PARAMS = frozenset({'hermetic', 'build-source-image', 'build-args', 'build-platforms'})
+
+
+def load_pipeline_cache() -> Dict[str, Dict[str, str]]:
+    """Load cached upstream pipeline responses, or an empty cache if unavailable."""
+    try:
+        with open(PIPELINE_CACHE_FILE, 'r') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def save_pipeline_cache(cache: Dict[str, Dict[str, str]]) -> None:
+    """Save cached upstream pipeline responses for the next run.
+    
+    Bodies no longer named by the index (superseded or never indexed) are removed.
+    """
+    try:
+        os.makedirs(PIPELINE_CACHE_DIR, exist_ok=True)
+        with open(PIPELINE_CACHE_FILE, 'w') as f:
+            json.dump(cache, f)
+        
+        indexed = {os.path.basename(cached_body_path(url, entry['etag'])) for url, entry in cache.items()}
+        for name in os.listdir(PIPELINE_CACHE_DIR):
+            if name.endswith('.yaml') and name not in indexed:
+                os.remove(os.path.join(PIPELINE_CACHE_DIR, name))
+    except OSError as e:
+        print(f"⚠️  Could not save pipeline cache: {e}")
+
+
+def cached_etag(cache: Dict[str, Dict[str, str]], url: str) -> Optional[str]:
+    """Return the cached ETag for a URL, if its body is still on disk."""
+    etag = cache.get(url, {}).get('etag')
+    return etag if etag and os.path.exists(cached_body_path(url, etag)) else None
 
-def fetch_upstream_pipeline(url: str) -> Dict[str, Any]:
-    """Fetch upstream pipeline YAML from GitHub."""
+
+def cached_body_path(url: str, etag: str) -> str:
+    """Return the path of the cached upstream body for a URL and ETag.
+    
+    Keying the file by ETag means an index entry can only ever resolve to the
+    body it was downloaded with, even if the index was not saved afterwards.
+    """
+    return os.path.join(PIPELINE_CACHE_DIR, hashlib.sha256(f'{url}\n{etag}'.encode()).hexdigest() + '.yaml')
+
+
+def download_upstream_pipeline(url: str, etag: Optional[str] = None) -> requests.Response:
+    """Download an upstream pipeline from GitHub, revalidating against a cached ETag if given.
+    
+    Runs on the prefetch pool, so it raises errors instead of printing them;
+    a 304 response is returned for fetch_upstream_pipeline() to resolve.
+    """
+    headers = {'If-None-Match': etag} if etag else {}
+    response = SESSION.get(url, headers=headers, timeout=REQUEST_TIMEOUT)
+    response.raise_for_status()
+    return response
+
+
+def fetch_upstream_pipeline(url: str, response_future: Future,
+                            cache: Dict[str, Dict[str, str]]) -> Dict[str, Any]:
+    """Parse a prefetched upstream pipeline, using or refreshing the cached copy."""
     try:
-        response = requests.get(url)
-        response.raise_for_status()
-        return yaml.safe_load(response.text)
+        response = response_future.result()
+        etag = response.request.headers.get('If-None-Match')
+        if etag and response.status_code == 304:
+            with open(cached_body_path(url, etag), 'rb') as f:
+                return yaml.load(f, Loader=SafeLoader)
+        
+        if 'ETag' in response.headers:
+            # The cache only saves work on later runs, so failing to write it is
+            # not fatal; the body is parsed from the downloaded bytes either way
+            try:
+                os.makedirs(PIPELINE_CACHE_DIR, exist_ok=True)
+                body_path = cached_body_path(url, response.headers['ETag'])
+                with open(body_path + '.tmp', 'wb') as f:
+                    f.write(response.content)
+                os.replace(body_path + '.tmp', body_path)
+                cache[url] = {'etag': response.headers['ETag']}
+            except OSError as e:
+                print(f"⚠️  Could not cache upstream pipeline: {e}")
+        
+        return yaml.load(response.content, Loader=SafeLoader)
     except requests.RequestException as e:
         print(f"Error fetching upstream pipeline: {e}")
         sys.exit(1)
@@ -52,7 +154,7 @@ def load_local_pipeline(filepath: str) -> Dict[str, Any]:
     """Load local pipeline YAML file."""
     try:
         with open(filepath, 'r') as f:
-            return yaml.safe_load(f)
+            return yaml.load(f, Loader=SafeLoader)
     except FileNotFoundError:
         print(f"Local pipeline file not found: {filepath}")
         sys.exit(1)
@@ -65,71 +167,112 @@ def save_local_pipeline(filepath: str, data: Dict[str, Any]) -> None:
     """Save updated pipeline to local file."""
     try:
         with open(filepath, 'w') as f:
-            yaml.dump(data, f, default_flow_style=False, sort_keys=False, indent=2)
+            yaml.dump(data, f, Dumper=SafeDumper, default_flow_style=False, sort_keys=False, indent=2)
     except Exception as e:
         print(f"Error saving local pipeline: {e}")
         sys.exit(1)
 
 
-def remove_taskref_fields(data: Dict[str, Any]) -> Dict[str, Any]:
-    """Recursively remove taskRef fields from pipeline data for comparison."""
-    # Parameters to exclude from comparison (preserve local values)
-    PRESERVE_PARAMS = {'hermetic', 'build-source-image', 'build-args', 'build-platforms'}
+def _filter_preserved_params(params: List[Any]) -> List[Dict[str, Any]]:
+    """Drop preserved parameters (and non-dict entries) from a params list for comparison."""
+    return [param for param in params
+            if isinstance(param, dict) and param.get('name') not in PRESERVE_PARAMS]
+
+
+def _without_preserved_params(holder: Dict[str, Any]) -> Dict[str, Any]:
+    """Return holder with preserved parameters dropped from its params list, copying only if needed."""
+    if not isinstance(holder.get('params'), list):
+        return holder
+    return {**holder, 'params': _filter_preserved_params(holder['params'])}
+
+
+def _clean_embedded_spec(data: Any) -> Any:
+    """Recursively remove taskRef fields and preserved params from an embedded task or pipeline spec.
     
+    Embedded specs can nest params at arbitrary depth (e.g. step params), so they
+    get the full recursive treatment instead of the schema-aware fast path.
+    """
     if isinstance(data, dict):
         cleaned = {}
         for key, value in data.items():
             if key == 'taskRef':
                 continue  # Skip taskRef entirely
             elif key == 'params' and isinstance(value, list):
-                # Filter out preserved parameters from comparison
-                filtered_params = []
-                for param in value:
-                    if isinstance(param, dict) and param.get('name') not in PRESERVE_PARAMS:
-                        filtered_params.append(remove_taskref_fields(param))
-                cleaned[key] = filtered_params
-            elif isinstance(value, (dict, list)):
-                cleaned[key] = remove_taskref_fields(value)
+                cleaned[key] = [_clean_embedded_spec(param) for param in _filter_preserved_params(value)]
             else:
-                cleaned[key] = value
+                cleaned[key] = _clean_embedded_spec(value)
         return cleaned
     elif isinstance(data, list):
-        return [remove_taskref_fields(item) for item in data]
+        return [_clean_embedded_spec(item) for item in data]
     else:
         return data
 
 
-def get_task_names(pipeline_spec: Dict[str, Any]) -> Set[str]:
-    """Extract task names from pipeline spec."""
-    task_names = set()
+def _clean_pipeline_task(task: Dict[str, Any]) -> Dict[str, Any]:
+    """Return a pipeline task without taskRef and preserved params (task, matrix and embedded spec level)."""
+    cleaned = _without_preserved_params({key: value for key, value in task.items() if key != 'taskRef'})
+    
+    for key in ('taskSpec', 'pipelineSpec'):
+        if key in cleaned:
+            cleaned[key] = _clean_embedded_spec(cleaned[key])
     
-    if 'tasks' in pipeline_spec:
-        for task in pipeline_spec['tasks']:
-            if 'name' in task:
-                task_names.add(task['name'])
+    matrix = cleaned.get('matrix')
+    if isinstance(matrix, dict):
+        matrix = _without_preserved_params(matrix)
+        if isinstance(matrix.get('include'), list):
+            matrix = {**matrix, 'include': [_without_preserved_params(entry) if isinstance(entry, dict) else entry
+                                            for entry in matrix['include']]}
+        cleaned['matrix'] = matrix
     
-    if 'finally' in pipeline_spec:
-        for task in pipeline_spec['finally']:
-            if 'name' in task:
-                task_names.add(task['name'])
+    return cleaned
+
+
+def clean_pipeline_spec(spec: Dict[str, Any]) -> Dict[str, Any]:
+    """Return a view of a pipeline spec without taskRef fields and preserved parameters.
     
-    return task_names
+    Only descends where the Tekton Pipeline schema allows taskRef and params
+    (spec.params and each entry of spec.tasks and spec.finally, including any
+    embedded taskSpec/pipelineSpec); everything else is shared by reference
+    with the original spec, not copied.
+    """
+    cleaned = _without_preserved_params(dict(spec))
+    for section in ('tasks', 'finally'):
+        if isinstance(cleaned.get(section), list):
+            cleaned[section] = [_clean_pipeline_task(task) if isinstance(task, dict) else task
+                                for task in cleaned[section]]
+    return cleaned
 
 
-def download_pipeline_patcher(script_dir: str) -> str:
-    """Download the konflux-pipeline-patcher tool if it doesn't exist."""
+def get_task_names(pipeline_spec: Dict[str, Any]) -> Set[str]:
+    """Extract task names from pipeline spec."""
+    return {task['name'] for section in ('tasks', 'finally')
+            for task in pipeline_spec.get(section, []) if 'name' in task}
+
+
+@functools.lru_cache(maxsize=1)
+def download_pipeline_patcher(script_dir: str) -> Optional[str]:
+    """Download the konflux-pipeline-patcher tool if it doesn't exist.
+    
+    Resolved at most once per run; later calls return the same path.
+    """
     patcher_path = os.path.join(script_dir, 'pipeline-patcher')
     
     if not os.path.exists(patcher_path):
         print("📥 Downloading konflux-pipeline-patcher tool...")
         try:
-            response = requests.get('https://github.com/simonbaird/konflux-pipeline-patcher/raw/main/pipeline-patcher')
-            response.raise_for_status()
-            
-            with open(patcher_path, 'wb') as f:
-                f.write(response.content)
+            # Stream to a temporary file so an interrupted download never leaves
+            # a truncated patcher behind for the next run to pick up
+            download_path = patcher_path + '.tmp'
+            with SESSION.get('https://github.com/simonbaird/konflux-pipeline-patcher/raw/main/pipeline-patcher',
+                             timeout=REQUEST_TIMEOUT, stream=True) as response:
+                response.raise_for_status()
+                
+                with open(download_path, 'wb') as f:
+                    for chunk in response.iter_content(chunk_size=1 << 16):
+                        f.write(chunk)
             
-            os.chmod(patcher_path, 0o755)
+            os.chmod(download_path, 0o755)
+            os.replace(download_path, patcher_path)
             print(f"✅ Pipeline patcher downloaded to {patcher_path}")
         except Exception as e:
             print(f"❌ Error downloading pipeline patcher: {e}")
@@ -140,8 +283,12 @@ def download_pipeline_patcher(script_dir: str) -> str:
     return patcher_path
 
 
-def get_available_tasks(patcher_path: str) -> Set[str]:
-    """Get list of available tasks from pipeline-patcher."""
+@functools.lru_cache(maxsize=1)
+def get_available_tasks(patcher_path: str) -> FrozenSet[str]:
+    """Get list of available tasks from pipeline-patcher.
+    
+    The list doesn't change within a run, so it is only fetched once.
+    """
     try:
         result = subprocess.run([patcher_path, 'list-tasks'], 
                               capture_output=True, text=True, check=True)
@@ -151,10 +298,10 @@ def get_available_tasks(patcher_path: str) -> Set[str]:
             if line.strip():
                 tasks.add(line.strip())
         
-        return tasks
+        return frozenset(tasks)
     except subprocess.CalledProcessError as e:
         print(f"❌ Error getting available tasks: {e}")
-        return set()
+        return frozenset()
 
 
 def patch_missing_tasks(patcher_path: str, pipeline_path: str, missing_tasks: Set[str]) -> bool:
@@ -223,25 +370,110 @@ def update_task_bundle_refs(patcher_path: str, repo_path: str) -> bool:
 
 def compare_specs(local_spec: Dict[str, Any], upstream_spec: Dict[str, Any]) -> bool:
     """Compare two pipeline specs, ignoring taskRef fields."""
-    local_clean = remove_taskref_fields(local_spec)
-    upstream_clean = remove_taskref_fields(upstream_spec)
+    # Identical specs are equal however taskRef and preserved params are treated,
+    # and the built-in comparison checks that in C, exiting on the first mismatch
+    if local_spec == upstream_spec:
+        return True
+    return clean_pipeline_spec(local_spec) == clean_pipeline_spec(upstream_spec)
+
+
+class LocalIndex(NamedTuple):
+    """Name lookups over a local pipeline spec, built in one pass and shared by diff and update."""
+    tasks_by_name: Dict[str, Dict[str, Any]]
+    finally_by_name: Dict[str, Dict[str, Any]]
+    params_by_name: Dict[str, Dict[str, Any]]
+    
+    @classmethod
+    def build(cls, spec: Dict[str, Any]) -> 'LocalIndex':
+        """Index the tasks, finally tasks and params of a pipeline spec by name."""
+        return cls(
+            tasks_by_name={task['name']: task for task in spec.get('tasks', []) if 'name' in task},
+            finally_by_name={task['name']: task for task in spec.get('finally', []) if 'name' in task},
+            params_by_name={param.get('name'): param for param in spec.get('params', [])},
+        )
     
-    return json.dumps(local_clean, sort_keys=True) == json.dumps(upstream_clean, sort_keys=True)
+    def task_names(self) -> Set[str]:
+        """Return the names of all tasks and finally tasks."""
+        return self.tasks_by_name.keys() | self.finally_by_name.keys()
 
 
-def update_pipeline_with_upstream(local_pipeline: Dict[str, Any], 
-                                upstream_pipeline: Dict[str, Any]) -> tuple[Dict[str, Any], bool]:
-    """Update local pipeline with upstream values, preserving taskRef fields and specific parameters."""
-    updated_pipeline = local_pipeline.copy()
+def _merge_params(index: LocalIndex, upstream_params: List[Dict[str, Any]]) -> tuple[List[Dict[str, Any]], bool]:
+    """Merge upstream params over local ones, preserving local values for PRESERVE_PARAMS."""
+    has_updates = False
+    
+    # Upstream params claim their local counterpart as they are processed,
+    # leaving only the local-only params behind
+    unclaimed_params = dict(index.params_by_name)
+    
+    # Build updated params list
+    updated_params = []
+    
+    # First, add all upstream params, but preserve local values for specified params
+    for upstream_param in upstream_params:
+        param_name = upstream_param.get('name')
+        local_param = unclaimed_params.pop(param_name, None)
+        
+        if param_name in PRESERVE_PARAMS and local_param is not None:
+            # Preserve local parameter
+            preserved_param = local_param.copy()
+            updated_params.append(preserved_param)
+            print(f"Preserving local value for param: {param_name}")
+        else:
+            # Use upstream parameter
+            if local_param is None or local_param != upstream_param:
+                print(f"Updating param: {param_name}")
+                has_updates = True
+            updated_params.append(upstream_param)
+    
+    # Add any local params that don't exist in upstream (shouldn't happen normally)
+    for param_name, local_param in unclaimed_params.items():
+        print(f"Keeping local-only param: {param_name}")
+        updated_params.append(local_param)
+    
+    return updated_params, has_updates
+
+
+def _merge_tasks(local_tasks_by_name: Dict[str, Dict[str, Any]], upstream_tasks: List[Dict[str, Any]],
+                 kind: str = 'task') -> tuple[List[Dict[str, Any]], bool]:
+    """Take upstream tasks in upstream order, preserving the taskRef of matching local tasks."""
     has_updates = False
+    updated_tasks = []
     
-    # Parameters to preserve from local pipeline (don't overwrite with upstream values)
-    PRESERVE_PARAMS = {'hermetic', 'build-source-image', 'build-args', 'build-platforms'}
+    for upstream_task in upstream_tasks:
+        task_name = upstream_task['name']
+        if task_name in local_tasks_by_name:
+            # Update existing task, preserve taskRef
+            updated_task = upstream_task.copy()
+            if 'taskRef' in local_tasks_by_name[task_name]:
+                updated_task['taskRef'] = local_tasks_by_name[task_name]['taskRef']
+            updated_tasks.append(updated_task)
+        else:
+            # New task from upstream
+            updated_tasks.append(upstream_task)
+            print(f"Adding new {kind}: {task_name}")
+            has_updates = True
+    
+    return updated_tasks, has_updates
+
+
+def update_pipeline_with_upstream(local_pipeline: Dict[str, Any], 
+                                upstream_pipeline: Dict[str, Any]) -> tuple[bool, Set[str], Set[str]]:
+    """Update local pipeline in place with upstream values, preserving taskRef fields and specific parameters.
+    
+    Returns whether anything changed, plus the task names of the local pipeline
+    (as it was before the update) and of upstream.
+    """
+    has_updates = False
     
     # Get specs for comparison (without taskRef fields)
     local_spec = local_pipeline.get('spec', {})
     upstream_spec = upstream_pipeline.get('spec', {})
     
+    # Index the local spec once; it serves both the task name report and the merge
+    index = LocalIndex.build(local_spec)
+    local_task_names = index.task_names()
+    upstream_task_names = get_task_names(upstream_spec)
+    
     # Compare specs
     specs_match = compare_specs(local_spec, upstream_spec)
     
@@ -253,89 +485,85 @@ def update_pipeline_with_upstream(local_pipeline: Dict[str, Any],
             if key not in ['tasks', 'finally', 'params']:
                 if key not in local_spec or local_spec[key] != value:
                     print(f"Updating spec.{key}")
-                    updated_pipeline['spec'][key] = value
+                    local_pipeline['spec'][key] = value
                     has_updates = True
         
         # Handle params - preserve specific parameters while updating others
         if 'params' in upstream_spec:
-            local_params = local_spec.get('params', [])
-            upstream_params = upstream_spec['params']
-            
-            # Create lookup maps for easier processing
-            local_params_map = {param.get('name'): param for param in local_params}
-            upstream_params_map = {param.get('name'): param for param in upstream_params}
-            
-            # Build updated params list
-            updated_params = []
-            
-            # First, add all upstream params, but preserve local values for specified params
-            for upstream_param in upstream_params:
-                param_name = upstream_param.get('name')
-                
-                if param_name in PRESERVE_PARAMS and param_name in local_params_map:
-                    # Preserve local parameter
-                    preserved_param = local_params_map[param_name].copy()
-                    updated_params.append(preserved_param)
-                    print(f"Preserving local value for param: {param_name}")
-                else:
-                    # Use upstream parameter
-                    if param_name not in local_params_map or local_params_map[param_name] != upstream_param:
-                        print(f"Updating param: {param_name}")
-                        has_updates = True
-                    updated_params.append(upstream_param)
-            
-            # Add any local params that don't exist in upstream (shouldn't happen normally)
-            for local_param in local_params:
-                param_name = local_param.get('name')
-                if param_name not in upstream_params_map:
-                    print(f"Keeping local-only param: {param_name}")
-                    updated_params.append(local_param)
-            
-            updated_pipeline['spec']['params'] = updated_params
+            local_pipeline['spec']['params'], params_updated = _merge_params(index, upstream_spec['params'])
+            has_updates = has_updates or params_updated
         
         # Handle tasks - preserve taskRef but update other fields
         if 'tasks' in upstream_spec:
-            local_tasks = {task['name']: task for task in local_spec.get('tasks', [])}
-            updated_tasks = []
-            
-            for upstream_task in upstream_spec['tasks']:
-                task_name = upstream_task['name']
-                if task_name in local_tasks:
-                    # Update existing task, preserve taskRef
-                    updated_task = upstream_task.copy()
-                    if 'taskRef' in local_tasks[task_name]:
-                        updated_task['taskRef'] = local_tasks[task_name]['taskRef']
-                    updated_tasks.append(updated_task)
-                else:
-                    # New task from upstream
-                    updated_tasks.append(upstream_task)
-                    print(f"Adding new task: {task_name}")
-                    has_updates = True
-            
-            updated_pipeline['spec']['tasks'] = updated_tasks
+            local_pipeline['spec']['tasks'], tasks_updated = _merge_tasks(index.tasks_by_name, upstream_spec['tasks'])
+            has_updates = has_updates or tasks_updated
         
         # Handle finally tasks - preserve taskRef but update other fields
         if 'finally' in upstream_spec:
-            local_finally = {task['name']: task for task in local_spec.get('finally', [])}
-            updated_finally = []
-            
-            for upstream_task in upstream_spec['finally']:
-                task_name = upstream_task['name']
-                if task_name in local_finally:
-                    # Update existing task, preserve taskRef
-                    updated_task = upstream_task.copy()
-                    if 'taskRef' in local_finally[task_name]:
-                        updated_task['taskRef'] = local_finally[task_name]['taskRef']
-                    updated_finally.append(updated_task)
-                else:
-                    # New task from upstream
-                    updated_finally.append(upstream_task)
-                    print(f"Adding new finally task: {task_name}")
-                    has_updates = True
-            
-            updated_pipeline['spec']['finally'] = updated_finally
+            local_pipeline['spec']['finally'], finally_updated = _merge_tasks(
+                index.finally_by_name, upstream_spec['finally'], kind='finally task')
+            has_updates = has_updates or finally_updated
     
-    return updated_pipeline, has_updates
+    return has_updates, local_task_names, upstream_task_names
+
+
+def process_pipeline(upstream_url: str, local_path: str, upstream_future: Future,
+                     pipeline_cache: Dict[str, Dict[str, str]]) -> Optional[Dict[str, Any]]:
+    """Compare and update a single pipeline once its upstream fetch completes, returning its info."""
+    print(f"📄 Processing pipeline: {local_path}")
+    print(f"   Upstream: {upstream_url}")
+    
+    try:
+        # Load pipelines
+        print("   Fetching upstream pipeline...")
+        upstream_pipeline = fetch_upstream_pipeline(upstream_url, upstream_future, pipeline_cache)
+        
+        print("   Loading local pipeline...")
+        local_pipeline = load_local_pipeline(local_path)
+        
+        print("   Comparing pipelines...")
+        
+        # Update pipeline with upstream changes
+        print(f"   === UPDATING PIPELINE ===")
+        has_updates, local_tasks, upstream_tasks = update_pipeline_with_upstream(local_pipeline, upstream_pipeline)
+        
+        # Find missing tasks
+        missing_tasks = upstream_tasks - local_tasks
+        extra_tasks = local_tasks - upstream_tasks
+        
+        print(f"   Local tasks: {len(local_tasks)} tasks")
+        print(f"   Upstream tasks: {len(upstream_tasks)} tasks")
+        
+        if missing_tasks:
+            print(f"   ⚠️  MISSING TASKS:")
+            for task in sorted(missing_tasks):
+                print(f"     - {task}")
+        
+        if extra_tasks:
+            print(f"   🔍 EXTRA TASKS:")
+            for task in sorted(extra_tasks):
+                print(f"     - {task}")
+        
+        if has_updates:
+            print("   ✅ Updates found - saving updated pipeline...")
+            save_local_pipeline(local_path, local_pipeline)
+            print(f"   Pipeline updated successfully: {local_path}")
+        else:
+            print("   ✅ No updates needed - local pipeline is up to date")
+        
+        print()
+        return {
+            'upstream_url': upstream_url,
+            'local_path': local_path,
+            'upstream_tasks': upstream_tasks,
+            'missing_tasks': missing_tasks,
+            'has_updates': has_updates,
+            'missing_tasks_patched': False  # Will be updated later if patching occurs
+        }
+    
+    except Exception as e:
+        print(f"   ❌ Error processing {local_path}: {e}")
+        return None
 
 
 def prompt_user_action(message: str, options: List[str]) -> str:
@@ -382,69 +610,25 @@ def main():
     overall_has_updates = False
     overall_missing_tasks = set()
     all_processed_pipelines = []
+    pipeline_cache = load_pipeline_cache()
     
-    for upstream_url, local_path in PIPELINE_MAPPINGS.items():
-        print(f"📄 Processing pipeline: {local_path}")
-        print(f"   Upstream: {upstream_url}")
+    # Start every upstream download up front so later pipelines are in flight
+    # while earlier ones are compared and saved. The pool only downloads;
+    # parsing, caching and all output stay on the main thread.
+    with ThreadPoolExecutor(max_workers=len(PIPELINE_MAPPINGS)) as executor:
+        upstream_futures = {upstream_url: executor.submit(download_upstream_pipeline, upstream_url,
+                                                          cached_etag(pipeline_cache, upstream_url))
+                            for upstream_url in PIPELINE_MAPPINGS}
         
-        try:
-            # Load pipelines
-            print("   Fetching upstream pipeline...")
-            upstream_pipeline = fetch_upstream_pipeline(upstream_url)
-            
-            print("   Loading local pipeline...")
-            local_pipeline = load_local_pipeline(local_path)
-            
-            print("   Comparing pipelines...")
-            
-            # Extract task names
-            local_tasks = get_task_names(local_pipeline.get('spec', {}))
-            upstream_tasks = get_task_names(upstream_pipeline.get('spec', {}))
-            
-            # Find missing tasks
-            missing_tasks = upstream_tasks - local_tasks
-            extra_tasks = local_tasks - upstream_tasks
-            
-            print(f"   Local tasks: {len(local_tasks)} tasks")
-            print(f"   Upstream tasks: {len(upstream_tasks)} tasks")
-            
-            if missing_tasks:
-                print(f"   ⚠️  MISSING TASKS:")
-                for task in sorted(missing_tasks):
-                    print(f"     - {task}")
-                overall_missing_tasks.update(missing_tasks)
-            
-            if extra_tasks:
-                print(f"   🔍 EXTRA TASKS:")
-                for task in sorted(extra_tasks):
-                    print(f"     - {task}")
+        for upstream_url, local_path in PIPELINE_MAPPINGS.items():
+            pipeline_info = process_pipeline(upstream_url, local_path, upstream_futures[upstream_url],
+                                             pipeline_cache)
+            if pipeline_info is None:
+                continue
             
-            # Update pipeline with upstream changes
-            print(f"   === UPDATING PIPELINE ===")
-            updated_pipeline, has_updates = update_pipeline_with_upstream(local_pipeline, upstream_pipeline)
-            
-            if has_updates:
-                print("   ✅ Updates found - saving updated pipeline...")
-                save_local_pipeline(local_path, updated_pipeline)
-                print(f"   Pipeline updated successfully: {local_path}")
-                overall_has_updates = True
-            else:
-                print("   ✅ No updates needed - local pipeline is up to date")
-            
-            # Store pipeline info for later processing
-            all_processed_pipelines.append({
-                'upstream_url': upstream_url,
-                'local_path': local_path,
-                'missing_tasks': missing_tasks,
-                'has_updates': has_updates,
-                'missing_tasks_patched': False  # Will be updated later if patching occurs
-            })
-            
-        except Exception as e:
-            print(f"   ❌ Error processing {local_path}: {e}")
-            continue
-        
-        print()
+            all_processed_pipelines.append(pipeline_info)
+            overall_has_updates = overall_has_updates or pipeline_info['has_updates']
+            overall_missing_tasks.update(pipeline_info['missing_tasks'])
     
     # Handle missing tasks with pipeline-patcher (for all pipelines)
     if overall_missing_tasks:
@@ -463,44 +647,47 @@ def main():
                 ]
             )
         
-        if "patch" in patch_action.lower() or "both" in patch_action.lower():
-            # Download pipeline-patcher tool
-            patcher_path = download_pipeline_patcher(script_dir)
-            
-            if patcher_path:
-                # Patch missing tasks for each pipeline
-                for i, pipeline_info in enumerate(all_processed_pipelines):
-                    if pipeline_info['missing_tasks']:
-                        print(f"\n🔧 Patching missing tasks for {pipeline_info['local_path']}...")
-                        patch_success = patch_missing_tasks(patcher_path, pipeline_info['local_path'], pipeline_info['missing_tasks'])
-                        
-                        if patch_success:
-                            # Update the pipeline info to track patching success
-                            all_processed_pipelines[i]['missing_tasks_patched'] = True
-                            
-                            print("🔄 Reloading pipeline after patching...")
-                            local_pipeline = load_local_pipeline(pipeline_info['local_path'])
-                            local_tasks = get_task_names(local_pipeline.get('spec', {}))
-                            
-                            # Re-fetch upstream to get current task names
-                            upstream_pipeline = fetch_upstream_pipeline(pipeline_info['upstream_url'])
-                            upstream_tasks = get_task_names(upstream_pipeline.get('spec', {}))
-                            
-                            remaining_missing = upstream_tasks - local_tasks
-                            
-                            if remaining_missing:
-                                print(f"⚠️  Still missing tasks after patching:")
-                                for task in sorted(remaining_missing):
-                                    print(f"  - {task}")
-                            else:
-                                print("✅ All missing tasks have been patched!")
-        
-        if "update" in patch_action.lower() or "both" in patch_action.lower():
-            if 'patcher_path' not in locals():
-                patcher_path = download_pipeline_patcher(script_dir)
+        patch_tasks = "patch" in patch_action.lower() or "both" in patch_action.lower()
+        bump_refs = "update" in patch_action.lower() or "both" in patch_action.lower()
+        
+        # Resolve the pipeline-patcher tool once for whichever actions were chosen
+        patcher_path = download_pipeline_patcher(script_dir) if patch_tasks or bump_refs else None
+        
+        if patch_tasks and patcher_path:
+            # Coalesce mappings that share a local file into one pipeline-patcher
+            # invocation (it has no batch mode). Files are patched one at a time:
+            # each run stages task snippets at fixed /tmp/<task>.yaml paths.
+            pending_patches = {}  # local_path -> (pipeline infos, missing tasks)
+            for pipeline_info in all_processed_pipelines:
+                if pipeline_info['missing_tasks']:
+                    pipeline_infos, missing_tasks = pending_patches.setdefault(pipeline_info['local_path'], ([], set()))
+                    pipeline_infos.append(pipeline_info)
+                    missing_tasks.update(pipeline_info['missing_tasks'])
             
-            if patcher_path:
-                update_task_bundle_refs(patcher_path, '.')
+            for local_path, (pipeline_infos, missing_tasks) in pending_patches.items():
+                print(f"\n🔧 Patching missing tasks for {local_path}...")
+                if patch_missing_tasks(patcher_path, local_path, missing_tasks):
+                    # Update the pipeline info to track patching success
+                    for pipeline_info in pipeline_infos:
+                        pipeline_info['missing_tasks_patched'] = True
+                    
+                    print("🔄 Reloading pipeline after patching...")
+                    local_pipeline = load_local_pipeline(local_path)
+                    local_tasks = get_task_names(local_pipeline.get('spec', {}))
+                    
+                    # Upstream task names were already collected when the pipelines were processed
+                    upstream_tasks = set().union(*(info['upstream_tasks'] for info in pipeline_infos))
+                    remaining_missing = upstream_tasks - local_tasks
+                    
+                    if remaining_missing:
+                        print(f"⚠️  Still missing tasks after patching:")
+                        for task in sorted(remaining_missing):
+                            print(f"  - {task}")
+                    else:
+                        print("✅ All missing tasks have been patched!")
+        
+        if bump_refs and patcher_path:
+            update_task_bundle_refs(patcher_path, '.')
     
     elif update_refs:
         print("=== UPDATING TASK BUNDLE REFERENCES ===")
@@ -508,6 +695,8 @@ def main():
         if patcher_path:
             update_task_bundle_refs(patcher_path, '.')
     
+    save_pipeline_cache(pipeline_cache)
+    
     print("=== SYNC COMPLETE ===")
     print(f"Processed {len(all_processed_pipelines)} pipeline(s)")
     print(f"Updates made: {overall_has_updates}")